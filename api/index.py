@@ -1,21 +1,44 @@
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, List, Optional
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from fastapi import FastAPI, Query, Request as FastAPIRequest, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from openai import OpenAI
 import httpx
 import json
+import os
 from .utils.prompt import ClientMessage, convert_to_openai_messages
 from .utils.stream import patch_response_with_headers, stream_text, stream_ollama_text
-from .utils.tools import AVAILABLE_TOOLS, TOOL_DEFINITIONS
-from vercel import oidc
 from vercel.headers import set_headers
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 load_dotenv(".env.local")
 
-app = FastAPI()
+OLLAMA_TAGS_CACHE_TTL = 15
+
+
+def warm_up() -> None:
+    """Import the SDKs and tool modules that are otherwise loaded on first use."""
+    import openai  # noqa: F401
+    import requests  # noqa: F401
+    from vercel import oidc  # noqa: F401
+    from .utils import tools  # noqa: F401
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Long-running servers can pay the import cost up front; serverless cold
+    # starts leave NEXUS_WARMUP unset so each route only loads what it needs.
+    if os.environ.get("NEXUS_WARMUP") == "1":
+        warm_up()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.middleware("http")
@@ -33,12 +56,55 @@ class OllamaRequest(BaseModel):
     ollama_url: str = "http://localhost:11434"
 
 
+def get_oidc_token() -> str:
+    from vercel import oidc
+
+    return oidc.get_vercel_oidc_token()
+
+
+def get_openai_client(api_key: str) -> "OpenAI":
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, base_url="https://ai-gateway.vercel.sh/v1")
+
+
+async def fetch_ollama_tags(ollama_url: str, timeout: float) -> Optional[dict]:
+    """Return the Ollama ``/api/tags`` payload, or ``None`` if the service answered with an error
+    or a body that is not JSON.
+
+    Successful responses are shared across workers for a few seconds; connection
+    failures propagate as ``httpx.RequestError``. Cache access runs in the
+    threadpool so a locked database never blocks the event loop.
+    """
+    from .utils.cache import get_shared_cache
+
+    cache = get_shared_cache()
+    cache_key = f"ollama:tags:{ollama_url}"
+    cached = await run_in_threadpool(cache.get, cache_key)
+    if cached is not None:
+        return cached
+
+    async with httpx.AsyncClient() as client:
+        response = await client.get(f"{ollama_url}/api/tags", timeout=timeout)
+    if response.status_code != 200:
+        return None
+
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    await run_in_threadpool(cache.set, cache_key, data, OLLAMA_TAGS_CACHE_TTL)
+    return data
+
+
 @app.post("/api/chat")
 async def handle_chat_data(request: Request, protocol: str = Query('data')):
     messages = request.messages
     openai_messages = convert_to_openai_messages(messages)
 
-    client = OpenAI(api_key=oidc.get_vercel_oidc_token(), base_url="https://ai-gateway.vercel.sh/v1")
+    from .utils.tools import AVAILABLE_TOOLS, TOOL_DEFINITIONS
+
+    client = get_openai_client(get_oidc_token())
     response = StreamingResponse(
         stream_text(client, openai_messages, TOOL_DEFINITIONS, AVAILABLE_TOOLS, protocol),
         media_type="text/event-stream",
@@ -52,10 +118,8 @@ async def handle_ollama_chat(request: OllamaRequest, protocol: str = Query('data
     
     # Check if Ollama is available
     try:
-        async with httpx.AsyncClient() as client:
-            health_response = await client.get(f"{request.ollama_url}/api/tags", timeout=5.0)
-            if health_response.status_code != 200:
-                raise HTTPException(status_code=503, detail="Ollama service is not available")
+        if await fetch_ollama_tags(request.ollama_url, timeout=5.0) is None:
+            raise HTTPException(status_code=503, detail="Ollama service is not available")
     except httpx.RequestError:
         raise HTTPException(status_code=503, detail="Cannot connect to Ollama service")
     
@@ -68,21 +132,18 @@ async def handle_ollama_chat(request: OllamaRequest, protocol: str = Query('data
 @app.get("/api/ollama/models")
 async def get_ollama_models(ollama_url: str = Query("http://localhost:11434")):
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{ollama_url}/api/tags", timeout=10.0)
-            if response.status_code == 200:
-                data = response.json()
-                return {"models": [model["name"] for model in data.get("models", [])]}
-            else:
-                raise HTTPException(status_code=503, detail="Ollama service returned an error")
+        data = await fetch_ollama_tags(ollama_url, timeout=10.0)
+        if data is not None:
+            return {"models": [model["name"] for model in data.get("models", [])]}
+        else:
+            raise HTTPException(status_code=503, detail="Ollama service returned an error")
     except httpx.RequestError:
         raise HTTPException(status_code=503, detail="Cannot connect to Ollama service")
 
 @app.get("/api/ollama/health")
 async def check_ollama_health(ollama_url: str = Query("http://localhost:11434")):
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{ollama_url}/api/tags", timeout=5.0)
-            return {"status": "connected" if response.status_code == 200 else "error"}
+        data = await fetch_ollama_tags(ollama_url, timeout=5.0)
+        return {"status": "connected" if data is not None else "error"}
     except httpx.RequestError:
         return {"status": "disconnected"}
@@ -0,0 +1,21 @@
+import os
+
+import uvicorn
+
+from .utils.cache import get_shared_cache
+
+
+def main() -> None:
+    """Run the API under several uvicorn workers that share one on-disk cache."""
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    host = os.environ.get("HOST", "127.0.0.1")
+    port = int(os.environ.get("PORT", "8000"))
+
+    # Workers are long-lived, so load the SDKs at startup rather than on first request.
+    os.environ.setdefault("NEXUS_WARMUP", "1")
+    get_shared_cache().purge_expired()
+    uvicorn.run("api.index:app", host=host, port=port, workers=workers)
+
+
+if __name__ == "__main__":
+    main()
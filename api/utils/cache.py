@@ -0,0 +1,173 @@
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+def _default_cache_dir() -> str:
+    suffix = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"nexus-ai-tarot-{suffix}")
+
+
+DEFAULT_CACHE_PATH = os.path.join(_default_cache_dir(), "cache.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def _ensure_private(path: str) -> None:
+    """Create the cache file owner-only and refuse one another local user could have planted.
+
+    SQLite gives the ``-wal`` and ``-shm`` files the same mode as the database,
+    so creating the database as 0600 keeps all three private.
+    """
+    if not hasattr(os, "getuid"):
+        return
+
+    directory = os.path.dirname(path)
+    if directory == _default_cache_dir():
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        info = os.stat(directory)
+        if info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise sqlite3.OperationalError(f"cache directory {directory!r} is not private")
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    try:
+        info = os.fstat(fd)
+        if info.st_uid != os.getuid():
+            raise sqlite3.OperationalError(f"cache file {path!r} is not owned by the current user")
+        if info.st_mode & 0o077:
+            os.fchmod(fd, 0o600)
+    finally:
+        os.close(fd)
+
+
+class SharedCache:
+    """Key/value cache backed by a local SQLite file shared by every worker process.
+
+    The database runs in WAL mode with memory-mapped reads, so readers never
+    block each other and a write is a single atomic upsert. Values must be
+    JSON serialisable. The cache is best effort: a busy lock, a corrupt row or
+    an unsafe file is treated as a miss rather than failing the caller.
+
+    Keys can come from client input, so the file is bounded: values larger than
+    ``max_value_bytes`` are not stored, and roughly one write in
+    ``1 / purge_probability`` drops expired rows and trims the table to
+    ``max_entries``, evicting the entries closest to expiry first.
+
+    Calls block for up to ``busy_timeout`` while another process holds the
+    write lock; async callers should run them in a thread.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        mmap_size: int = 64 * 1024 * 1024,
+        busy_timeout: float = 0.05,
+        max_entries: int = 1024,
+        max_value_bytes: int = 256 * 1024,
+        purge_probability: float = 0.01,
+    ):
+        self.path = path
+        self.mmap_size = mmap_size
+        self.busy_timeout = busy_timeout
+        self.max_entries = max_entries
+        self.max_value_bytes = max_value_bytes
+        self.purge_probability = purge_probability
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            _ensure_private(self.path)
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+                connection.execute(_SCHEMA)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= time.time():
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError, TypeError):
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        serialized = json.dumps(value, separators=(",", ":"))
+        if len(serialized) > self.max_value_bytes:
+            return
+
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, serialized, time.time() + ttl),
+            )
+        except (sqlite3.Error, OSError):
+            return
+
+        if random.random() < self.purge_probability:
+            self.purge_expired()
+
+    def delete(self, key: str) -> None:
+        try:
+            self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def purge_expired(self) -> None:
+        """Drop expired rows, then the soonest-expiring ones beyond ``max_entries``."""
+        try:
+            connection = self._connection()
+            connection.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+            connection.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: float) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss.
+
+        ``None`` results are returned but never stored, so failures are retried.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = factory()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+
+_shared_cache: Optional[SharedCache] = None
+
+
+def get_shared_cache() -> SharedCache:
+    """Return the process-wide cache, located via ``NEXUS_CACHE_PATH`` if set."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SharedCache(os.environ.get("NEXUS_CACHE_PATH", DEFAULT_CACHE_PATH))
+    return _shared_cache
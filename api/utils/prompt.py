@@ -1,12 +1,14 @@
 import json
 from enum import Enum
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
 from pydantic import BaseModel, ConfigDict
 
 from .attachment import ClientAttachment
 
+if TYPE_CHECKING:
+    from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
+
 
 class ToolInvocationState(str, Enum):
     CALL = 'call'
@@ -45,7 +47,7 @@ class ClientMessage(BaseModel):
     toolInvocations: Optional[List[ToolInvocation]] = None
 
 
-def convert_to_openai_messages(messages: List[ClientMessage]) -> List[ChatCompletionMessageParam]:
+def convert_to_openai_messages(messages: List[ClientMessage]) -> List["ChatCompletionMessageParam"]:
     openai_messages = []
 
     for message in messages:
@@ -155,7 +157,7 @@ def convert_to_openai_messages(messages: List[ClientMessage]) -> List[ChatComple
             # Ensure that we always provide some content for OpenAI
             content_payload = ""
 
-        openai_message: ChatCompletionMessageParam = {
+        openai_message: "ChatCompletionMessageParam" = {
             "role": message.role,
             "content": content_payload,
         }
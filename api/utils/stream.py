@@ -2,16 +2,18 @@ import json
 import traceback
 import uuid
 import httpx
-from typing import Any, Callable, Dict, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Sequence
 
 from fastapi.responses import StreamingResponse
-from openai import OpenAI
-from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
 
 
 def stream_text(
-    client: OpenAI,
-    messages: Sequence[ChatCompletionMessageParam],
+    client: "OpenAI",
+    messages: Sequence["ChatCompletionMessageParam"],
     tool_definitions: Sequence[Dict[str, Any]],
     available_tools: Mapping[str, Callable[..., Any]],
     protocol: str = "data",
@@ -256,7 +258,7 @@ def patch_response_with_headers(
 async def stream_ollama_text(
     ollama_url: str,
     model: str,
-    messages: Sequence[ChatCompletionMessageParam],
+    messages: Sequence["ChatCompletionMessageParam"],
     protocol: str = "data",
 ):
     """Yield Server-Sent Events for a streaming Ollama chat completion."""
@@ -1,7 +1,20 @@
-import requests
+from .cache import get_shared_cache
+
+
+WEATHER_CACHE_TTL = 300
 
 
 def get_current_weather(latitude, longitude):
+    return get_shared_cache().get_or_set(
+        f"tool:get_current_weather:{latitude}:{longitude}",
+        lambda: fetch_current_weather(latitude, longitude),
+        WEATHER_CACHE_TTL,
+    )
+
+
+def fetch_current_weather(latitude, longitude):
+    import requests
+
     # Format the URL with proper parameter substitution
     url = f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current=temperature_2m&hourly=temperature_2m&daily=sunrise,sunset&timezone=auto"
 
@@ -0,0 +1,107 @@
+"""Measure cold-start cost of the FastAPI app, one fresh interpreter per route.
+
+For every route this reports how long ``import api.index`` takes, how long the
+first request takes on top of that, and which heavy SDKs ended up loaded.
+
+    python scripts/bench_startup.py [--repeat N] [--warmup]
+
+Routes that need Ollama or the AI Gateway still run when those services are
+unreachable; the benchmark records the status code rather than failing.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROUTES = [
+    ("GET", "/api/ollama/health", None),
+    ("GET", "/api/ollama/models", None),
+    ("POST", "/api/chat/ollama", {"messages": [{"role": "user", "content": "hi"}]}),
+    ("POST", "/api/chat", {"messages": [{"role": "user", "content": "hi"}]}),
+]
+
+HEAVY_MODULES = ["openai", "requests", "vercel.oidc"]
+
+_CHILD = """
+import json, sys, time
+
+method, path, body, heavy = json.loads(sys.argv[1])
+
+start = time.perf_counter()
+import api.index
+imported = time.perf_counter()
+
+from fastapi.testclient import TestClient
+
+# Time to first request includes app startup, so NEXUS_WARMUP shows up here.
+ready = time.perf_counter()
+with TestClient(api.index.app, raise_server_exceptions=False) as client:
+    try:
+        response = client.request(method, path, json=body)
+        status = response.status_code
+    except Exception as error:
+        status = type(error).__name__
+    done = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (done - ready) * 1000,
+    "status": status,
+    "loaded": [name for name in heavy if name in sys.modules],
+}))
+"""
+
+
+def run_route(method, path, body, env):
+    argument = json.dumps([method, path, body, HEAVY_MODULES])
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD, argument],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true", help="set NEXUS_WARMUP=1 in the app")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ)
+        env["NEXUS_CACHE_PATH"] = os.path.join(cache_dir, "cache.sqlite3")
+        env.pop("NEXUS_WARMUP", None)
+        if args.warmup:
+            env["NEXUS_WARMUP"] = "1"
+
+        print(f"{'route':<28}{'import ms':>12}{'first req ms':>14}  status  loaded")
+        for method, path, body in ROUTES:
+            samples = []
+            for _ in range(args.repeat):
+                # Start every sample from an empty cache so no route benefits from a previous run.
+                for suffix in ("", "-wal", "-shm"):
+                    if os.path.exists(env["NEXUS_CACHE_PATH"] + suffix):
+                        os.remove(env["NEXUS_CACHE_PATH"] + suffix)
+                samples.append(run_route(method, path, body, env))
+
+            import_ms = statistics.median(sample["import_ms"] for sample in samples)
+            request_ms = statistics.median(sample["first_request_ms"] for sample in samples)
+            last = samples[-1]
+            print(
+                f"{method + ' ' + path:<28}{import_ms:>12.1f}{request_ms:>14.1f}"
+                f"  {last['status']!s:<6}  {', '.join(last['loaded']) or '-'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
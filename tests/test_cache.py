@@ -0,0 +1,139 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pytest
+
+from api.utils.cache import SharedCache
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache.sqlite3")
+
+
+def test_set_and_get(cache_path):
+    cache = SharedCache(cache_path)
+    cache.set("key", {"models": ["llama3"]}, ttl=60)
+
+    assert cache.get("key") == {"models": ["llama3"]}
+    assert cache.get("missing") is None
+
+
+def test_expired_entries_are_misses(cache_path):
+    cache = SharedCache(cache_path)
+    cache.set("key", "value", ttl=0.01)
+    time.sleep(0.05)
+
+    assert cache.get("key") is None
+
+
+def test_get_or_set_does_not_store_none(cache_path):
+    cache = SharedCache(cache_path)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_set("key", factory, ttl=60) is None
+    assert cache.get_or_set("key", factory, ttl=60) is None
+    assert len(calls) == 2
+
+    assert cache.get_or_set("key", lambda: 42, ttl=60) == 42
+    assert cache.get_or_set("key", factory, ttl=60) == 42
+    assert len(calls) == 2
+
+
+def test_instances_share_the_same_file(cache_path):
+    writer = SharedCache(cache_path)
+    reader = SharedCache(cache_path)
+    writer.set("key", [1, 2, 3], ttl=60)
+
+    assert reader.get("key") == [1, 2, 3]
+
+
+def test_writes_from_another_process_are_visible(cache_path):
+    cache = SharedCache(cache_path)
+    cache.set("warm", True, ttl=60)
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from api.utils.cache import SharedCache; "
+            "SharedCache(sys.argv[1]).set('key', {'from': 'child'}, ttl=60)",
+            cache_path,
+        ],
+        cwd=ROOT,
+        check=True,
+    )
+
+    assert cache.get("key") == {"from": "child"}
+
+
+def test_oversized_values_are_not_stored(cache_path):
+    cache = SharedCache(cache_path, max_value_bytes=16)
+    cache.set("small", "ok", ttl=60)
+    cache.set("large", "x" * 100, ttl=60)
+
+    assert cache.get("small") == "ok"
+    assert cache.get("large") is None
+
+
+def test_purge_drops_expired_rows_and_trims_to_max_entries(cache_path):
+    cache = SharedCache(cache_path, max_entries=3)
+    cache.set("expired", 0, ttl=-1)
+    for index in range(5):
+        cache.set(f"key{index}", index, ttl=60 + index)
+
+    cache.purge_expired()
+
+    with sqlite3.connect(cache_path) as connection:
+        keys = {row[0] for row in connection.execute("SELECT key FROM cache")}
+    assert keys == {"key2", "key3", "key4"}
+
+
+def test_writes_purge_without_an_explicit_call(cache_path):
+    cache = SharedCache(cache_path, max_entries=2, purge_probability=1.0)
+    for index in range(4):
+        cache.set(f"key{index}", index, ttl=60 + index)
+
+    with sqlite3.connect(cache_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_cache_files_are_owner_only(cache_path):
+    previous = os.umask(0o022)
+    try:
+        SharedCache(cache_path).set("key", "value", ttl=60)
+    finally:
+        os.umask(previous)
+
+    for suffix in ("", "-wal", "-shm"):
+        assert os.stat(cache_path + suffix).st_mode & 0o077 == 0
+
+
+def test_corrupt_row_is_a_miss(cache_path):
+    cache = SharedCache(cache_path)
+    cache.set("key", "value", ttl=60)
+    with sqlite3.connect(cache_path) as connection:
+        connection.execute("UPDATE cache SET value = 'not json' WHERE key = 'key'")
+
+    assert cache.get("key") is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs root to chown")
+def test_foreign_cache_file_is_refused(cache_path):
+    SharedCache(cache_path).set("key", "value", ttl=60)
+    os.chown(cache_path, 65534, 65534)
+
+    cache = SharedCache(cache_path)
+    cache.set("other", "value", ttl=60)
+    assert cache.get("key") is None
@@ -0,0 +1,107 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import api.index
+from api.utils import cache as cache_module
+from api.utils import tools
+
+
+OLLAMA_URL = "http://ollama.test"
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEXUS_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(cache_module, "_shared_cache", None)
+    return cache_module.get_shared_cache()
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    """Route the app's outgoing httpx calls to a handler the test controls."""
+    state = {"calls": 0, "handler": None}
+    real_async_client = httpx.AsyncClient
+
+    def handler(request):
+        state["calls"] += 1
+        return state["handler"](request)
+
+    def async_client(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return real_async_client(*args, **kwargs)
+
+    monkeypatch.setattr(api.index.httpx, "AsyncClient", async_client)
+    return state
+
+
+@pytest.fixture
+def client():
+    return TestClient(api.index.app)
+
+
+def test_tags_json_is_cached(client, ollama):
+    ollama["handler"] = lambda request: httpx.Response(200, json={"models": [{"name": "llama3"}]})
+
+    first = client.get("/api/ollama/models", params={"ollama_url": OLLAMA_URL})
+    second = client.get("/api/ollama/health", params={"ollama_url": OLLAMA_URL})
+
+    assert first.json() == {"models": ["llama3"]}
+    assert second.json() == {"status": "connected"}
+    assert ollama["calls"] == 1
+
+
+def test_error_status_is_not_cached(client, ollama):
+    ollama["handler"] = lambda request: httpx.Response(500)
+
+    for _ in range(2):
+        assert client.get("/api/ollama/models", params={"ollama_url": OLLAMA_URL}).status_code == 503
+    assert ollama["calls"] == 2
+
+
+def test_non_json_body_is_an_error_and_not_cached(client, ollama):
+    ollama["handler"] = lambda request: httpx.Response(200, text="not json")
+
+    for _ in range(2):
+        response = client.get("/api/ollama/health", params={"ollama_url": OLLAMA_URL})
+        assert response.json() == {"status": "error"}
+    assert ollama["calls"] == 2
+
+
+def test_connection_errors_are_reported(client, ollama):
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    ollama["handler"] = refuse
+    params = {"ollama_url": OLLAMA_URL}
+
+    assert client.get("/api/ollama/health", params=params).json() == {"status": "disconnected"}
+    assert client.get("/api/ollama/models", params=params).status_code == 503
+    response = client.post(
+        "/api/chat/ollama",
+        json={"messages": [{"role": "user", "content": "hi"}], "ollama_url": OLLAMA_URL},
+    )
+    assert response.status_code == 503
+
+
+def test_weather_tool_serves_cached_results(monkeypatch):
+    import requests
+
+    calls = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"current": {"temperature_2m": 21.5}}
+
+    def fake_get(url):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    assert tools.get_current_weather(52.5, 13.4) == {"current": {"temperature_2m": 21.5}}
+    assert tools.get_current_weather(52.5, 13.4) == {"current": {"temperature_2m": 21.5}}
+    assert len(calls) == 1
@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ["openai", "requests", "vercel.oidc", "api.utils.tools"]
+
+_CHILD = """
+import json, sys
+
+import api.index
+after_import = sorted(name for name in sys.modules if name in ("sqlite3", "api.utils.cache"))
+
+from fastapi.testclient import TestClient
+
+with TestClient(api.index.app) as client:
+    # Nothing listens on the discard port, so the health check fails fast.
+    response = client.get("/api/ollama/health", params={"ollama_url": "http://127.0.0.1:9"})
+
+print(json.dumps({
+    "status": response.json()["status"],
+    "after_import": after_import,
+    "loaded": sorted(name for name in json.loads(sys.argv[1]) if name in sys.modules),
+}))
+"""
+
+
+def run_health_check(tmp_path, warmup):
+    env = dict(os.environ)
+    env["NEXUS_CACHE_PATH"] = str(tmp_path / "cache.sqlite3")
+    env.pop("NEXUS_WARMUP", None)
+    if warmup:
+        env["NEXUS_WARMUP"] = "1"
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD, json.dumps(LAZY_MODULES)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_health_route_does_not_load_sdks(tmp_path):
+    result = run_health_check(tmp_path, warmup=False)
+
+    assert result["status"] == "disconnected"
+    assert result["after_import"] == []
+    assert result["loaded"] == []
+
+
+def test_warmup_loads_sdks_at_startup(tmp_path):
+    result = run_health_check(tmp_path, warmup=True)
+
+    assert result["status"] == "disconnected"
+    assert result["loaded"] == sorted(LAZY_MODULES)